@@ -26,21 +26,7 @@ public class EmployeeController : ControllerBase
     {
         try
         {
-            var employees = await _employeeService.GetAllEmployeesAsync();
-
-            var employeesResponse = employees.Select(e => new EmployeeResponseDto
-            {
-                Id = e.Id,
-                FirstName = e.FirstName,
-                LastName = e.LastName,
-                Username = e.Username,
-                FullName = e.FullName,
-                Role = e.Role,
-                HireDate = e.HireDate,
-                BirthDate = e.BirthDate,
-                CreatedAt = e.CreatedAt,
-                UpdatedAt = e.UpdatedAt
-            });
+            var employeesResponse = await _employeeService.GetAllEmployeeResponsesAsync();
 
             return Ok(employeesResponse);
         }
@@ -71,7 +71,7 @@ public class TimeOffRequestController : ControllerBase
             var employeeId = GetCurrentEmployeeId();
 
             // Both managers and employees can use this endpoint, but managers should use the manager endpoint for status changes
-            var request = await _timeOffRequestService.UpdateRequestAsync(id, employeeId, dto);
+            var request = await _timeOffRequestService.UpdateRequestAsync(id, employeeId, currentRole, dto);
             var response = await _timeOffRequestService.GetRequestByIdAsync(request.Id);
 
             return Ok(response);
@@ -98,8 +98,9 @@ public class TimeOffRequestController : ControllerBase
     {
         try
         {
+            var currentRole = GetCurrentUserRole();
             var employeeId = GetCurrentEmployeeId();
-            await _timeOffRequestService.DeleteRequestAsync(id, employeeId);
+            await _timeOffRequestService.DeleteRequestAsync(id, employeeId, currentRole);
 
             return NoContent();
         }
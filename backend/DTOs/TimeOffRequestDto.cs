@@ -43,6 +43,14 @@ public class TimeOffRequestFilterDto
     public string? Status { get; set; }
     public string? FromDate { get; set; } // DD-MM-YYYY format
     public string? ToDate { get; set; } // DD-MM-YYYY format
+
+    // Optional paging; when omitted all matching requests are returned
+    // Upper bound keeps (Page - 1) * PageSize within int range
+    [Range(1, 1000000, ErrorMessage = "Pagina moet tussen 1 en 1000000 liggen")]
+    public int? Page { get; set; }
+
+    [Range(1, 200, ErrorMessage = "Paginagrootte moet tussen 1 en 200 liggen")]
+    public int? PageSize { get; set; }
 }
 
 public class UpdateTimeOffRequestAsManagerDto
@@ -112,6 +112,10 @@ public class ApplicationDbContext : DbContext
 			// Index for company lookups
 			entity.HasIndex(e => e.CompanyId)
 				  .HasDatabaseName("IX_Employees_CompanyId");
+
+			// Matches the employee list ordering (first name, then last name)
+			entity.HasIndex(e => new { e.FirstName, e.LastName })
+				  .HasDatabaseName("IX_Employees_FirstName_LastName");
 		});
 
 		// Configure RefreshToken entity
@@ -135,11 +139,15 @@ public class ApplicationDbContext : DbContext
 				  .OnDelete(DeleteBehavior.Cascade);
 
 			// Index for efficient token lookups during authentication
+			// Partial index: every lookup filters on active tokens, so revoked ones (kept for audit) stay out of it
 			entity.HasIndex(rt => rt.Token)
-				  .HasDatabaseName("IX_RefreshTokens_Token");
+				  .HasDatabaseName("IX_RefreshTokens_Token")
+				  .HasFilter("NOT \"IsRevoked\"");
 
-			entity.HasIndex(rt => rt.EmployeeId)
-				  .HasDatabaseName("IX_RefreshTokens_EmployeeId");
+			// Composite index for revoking all active tokens of an employee
+			// Also serves the employee foreign key, so no separate EmployeeId index is needed
+			entity.HasIndex(rt => new { rt.EmployeeId, rt.IsRevoked })
+				  .HasDatabaseName("IX_RefreshTokens_EmployeeId_IsRevoked");
 		});
 
 		// Configure Shift entity
@@ -326,10 +334,7 @@ public class ApplicationDbContext : DbContext
 			entity.HasIndex(tor => tor.CompanyId)
 				  .HasDatabaseName("IX_TimeOffRequests_CompanyId");
 
-			// Indexes
-			entity.HasIndex(tor => tor.EmployeeId)
-				  .HasDatabaseName("IX_TimeOffRequests_EmployeeId");
-
+			// EmployeeId lookups are served by the composite indexes below
 			entity.HasIndex(tor => tor.Status)
 				  .HasDatabaseName("IX_TimeOffRequests_Status");
 
@@ -342,6 +347,10 @@ public class ApplicationDbContext : DbContext
 
 			entity.HasIndex(tor => new { tor.CompanyId, tor.Status })
 				  .HasDatabaseName("IX_TimeOffRequests_CompanyId_Status");
+
+			// Matches the per-employee listing, which is ordered by creation date
+			entity.HasIndex(tor => new { tor.EmployeeId, tor.CreatedAt })
+				  .HasDatabaseName("IX_TimeOffRequests_EmployeeId_CreatedAt");
 		});
 	}
 }
\ No newline at end of file
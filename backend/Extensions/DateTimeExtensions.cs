@@ -46,6 +46,26 @@ public static class DateTimeExtensions
         return result.EnsureUtc();
     }
 
+    /// <summary>
+    /// Tries to parse a date string in the given format and ensures UTC kind
+    /// </summary>
+    /// <param name="dateString">The date string to parse</param>
+    /// <param name="format">Exact format string</param>
+    /// <param name="result">DateTime with UTC kind when parsing succeeded</param>
+    /// <returns>True if the string matched the format</returns>
+    public static bool TryParseAsUtc(string dateString, string format, out DateTime result)
+    {
+        if (DateTime.TryParseExact(dateString, format, System.Globalization.CultureInfo.InvariantCulture,
+                System.Globalization.DateTimeStyles.None, out var parsed))
+        {
+            result = parsed.EnsureUtc();
+            return true;
+        }
+
+        result = default;
+        return false;
+    }
+
     /// <summary>
     /// Current UTC time - use this instead of DateTime.UtcNow for consistency
     /// </summary>
@@ -0,0 +1,55 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace backend.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddTokenAndTimeOffListingIndexes : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_TimeOffRequests_EmployeeId_CreatedAt",
+                table: "TimeOffRequests",
+                columns: new[] { "EmployeeId", "CreatedAt" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_RefreshTokens_EmployeeId_IsRevoked",
+                table: "RefreshTokens",
+                columns: new[] { "EmployeeId", "IsRevoked" });
+
+            // The single-column indexes are covered by the composite indexes that start with EmployeeId
+            migrationBuilder.DropIndex(
+                name: "IX_TimeOffRequests_EmployeeId",
+                table: "TimeOffRequests");
+
+            migrationBuilder.DropIndex(
+                name: "IX_RefreshTokens_EmployeeId",
+                table: "RefreshTokens");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_TimeOffRequests_EmployeeId",
+                table: "TimeOffRequests",
+                column: "EmployeeId");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_RefreshTokens_EmployeeId",
+                table: "RefreshTokens",
+                column: "EmployeeId");
+
+            migrationBuilder.DropIndex(
+                name: "IX_TimeOffRequests_EmployeeId_CreatedAt",
+                table: "TimeOffRequests");
+
+            migrationBuilder.DropIndex(
+                name: "IX_RefreshTokens_EmployeeId_IsRevoked",
+                table: "RefreshTokens");
+        }
+    }
+}
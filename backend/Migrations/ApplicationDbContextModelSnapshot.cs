@@ -191,6 +191,9 @@ namespace backend.Migrations
                         .IsUnique()
                         .HasDatabaseName("IX_Employees_Username");
 
+                    b.HasIndex("FirstName", "LastName")
+                        .HasDatabaseName("IX_Employees_FirstName_LastName");
+
                     b.ToTable("Employees");
                 });
 
@@ -223,11 +226,12 @@ namespace backend.Migrations
 
                     b.HasKey("Id");
 
-                    b.HasIndex("EmployeeId")
-                        .HasDatabaseName("IX_RefreshTokens_EmployeeId");
-
                     b.HasIndex("Token")
-                        .HasDatabaseName("IX_RefreshTokens_Token");
+                        .HasDatabaseName("IX_RefreshTokens_Token")
+                        .HasFilter("NOT \"IsRevoked\"");
+
+                    b.HasIndex("EmployeeId", "IsRevoked")
+                        .HasDatabaseName("IX_RefreshTokens_EmployeeId_IsRevoked");
 
                     b.ToTable("RefreshTokens");
                 });
@@ -359,15 +363,15 @@ namespace backend.Migrations
                     b.HasIndex("CompanyId")
                         .HasDatabaseName("IX_TimeOffRequests_CompanyId");
 
-                    b.HasIndex("EmployeeId")
-                        .HasDatabaseName("IX_TimeOffRequests_EmployeeId");
-
                     b.HasIndex("Status")
                         .HasDatabaseName("IX_TimeOffRequests_Status");
 
                     b.HasIndex("CompanyId", "Status")
                         .HasDatabaseName("IX_TimeOffRequests_CompanyId_Status");
 
+                    b.HasIndex("EmployeeId", "CreatedAt")
+                        .HasDatabaseName("IX_TimeOffRequests_EmployeeId_CreatedAt");
+
                     b.HasIndex("EmployeeId", "Status")
                         .HasDatabaseName("IX_TimeOffRequests_EmployeeId_Status");
 
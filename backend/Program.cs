@@ -294,9 +294,9 @@ if (app.Environment.IsProduction())
             }
 
             // Ensure default admin user exists for fresh databases
-            var adminUser = await context.Employees.FirstOrDefaultAsync(e => e.Username == "admin");
+            var adminExists = await context.Employees.AnyAsync(e => e.Username == "admin");
 
-            if (adminUser == null)
+            if (!adminExists)
             {
                 Console.WriteLine("Creating default SuperAdmin user...");
 
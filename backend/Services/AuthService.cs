@@ -13,18 +13,15 @@ namespace backend.Services;
 public class AuthService : IAuthService
 {
     private readonly ApplicationDbContext _context;
-    private readonly IEmployeeService _employeeService;
     private readonly IConfiguration _configuration;
     private readonly ILogger<AuthService> _logger;
 
     public AuthService(
         ApplicationDbContext context,
-        IEmployeeService employeeService,
         IConfiguration configuration,
         ILogger<AuthService> logger)
     {
         _context = context;
-        _employeeService = employeeService;
         _configuration = configuration;
         _logger = logger;
     }
@@ -33,17 +30,13 @@ public class AuthService : IAuthService
     {
         try
         {
-            var isValid = await _employeeService.ValidatePasswordAsync(username, password);
-            if (!isValid)
-            {
-                return null;
-            }
-
+            // Load the employee once and verify the password against that same row,
+            // instead of looking the username up separately for validation
             var employee = await _context.Employees
                 .Include(e => e.Company)
                 .FirstOrDefaultAsync(e => e.Username == username);
 
-            if (employee == null)
+            if (employee == null || !BCrypt.Net.BCrypt.Verify(password, employee.PasswordHash))
             {
                 return null;
             }
@@ -229,11 +222,8 @@ public class AuthService : IAuthService
     /// </summary>
     public async Task<string> GenerateRefreshTokenAsync(int employeeId)
     {
-        var randomBytes = new byte[64];
-        using (var rng = RandomNumberGenerator.Create())
-        {
-            rng.GetBytes(randomBytes);
-        }
+        // 256 bits of randomness is plenty for an opaque token and keeps the indexed value at 44 characters
+        var randomBytes = RandomNumberGenerator.GetBytes(32);
 
         var refreshToken = Convert.ToBase64String(randomBytes);
 
@@ -253,10 +243,8 @@ public class AuthService : IAuthService
 
     public async Task<bool> ValidateRefreshTokenAsync(string token)
     {
-        var refreshToken = await _context.RefreshTokens
-            .FirstOrDefaultAsync(rt => rt.Token == token && !rt.IsRevoked && rt.ExpiresAt > DateTime.UtcNow);
-
-        return refreshToken != null;
+        return await _context.RefreshTokens
+            .AnyAsync(rt => rt.Token == token && !rt.IsRevoked && rt.ExpiresAt > DateTime.UtcNow);
     }
 
     /// <summary>
@@ -265,15 +253,9 @@ public class AuthService : IAuthService
     /// </summary>
     public async Task RevokeAllUserTokensAsync(int employeeId)
     {
-        var tokens = await _context.RefreshTokens
+        // Revoke in a single UPDATE statement instead of loading and saving every token
+        await _context.RefreshTokens
             .Where(rt => rt.EmployeeId == employeeId && !rt.IsRevoked)
-            .ToListAsync();
-
-        foreach (var token in tokens)
-        {
-            token.IsRevoked = true;
-        }
-
-        await _context.SaveChangesAsync();
+            .ExecuteUpdateAsync(setters => setters.SetProperty(rt => rt.IsRevoked, true));
     }
 }
\ No newline at end of file
@@ -38,31 +38,7 @@ public class AvailabilityService : IAvailabilityService
                 && a.Date <= weekEndDate)
             .ToListAsync();
 
-        var weekAvailability = new WeekAvailabilityDto
-        {
-            WeekStart = FormatDateString(mondayDate),
-            EmployeeId = employeeId,
-            EmployeeName = employee.FullName,
-            Days = new List<DayAvailabilityDto>()
-        };
-
-        // Create 7 days (Monday to Sunday)
-        for (int i = 0; i < 7; i++)
-        {
-            var currentDate = mondayDate.AddDays(i);
-            var availability = availabilities.FirstOrDefault(a => a.Date.Date == currentDate.Date);
-
-            weekAvailability.Days.Add(new DayAvailabilityDto
-            {
-                Id = availability?.Id,
-                Date = FormatDateString(currentDate),
-                DayOfWeek = GetDutchDayName(currentDate),
-                Status = availability?.Status,
-                Notes = availability?.Notes
-            });
-        }
-
-        return weekAvailability;
+        return BuildWeekAvailability(employeeId, employee.FullName, mondayDate, availabilities);
     }
 
     public async Task<List<WeekAvailabilityDto>> GetEmployeeAvailabilityAsync(int employeeId, string startDate, string endDate)
@@ -78,12 +54,27 @@ public class AvailabilityService : IAvailabilityService
         }
 
         var weeks = new List<WeekAvailabilityDto>();
-        var currentMonday = GetMondayOfWeek(start);
+        var firstMonday = GetMondayOfWeek(start);
+        var lastMonday = GetMondayOfWeek(end);
+
+        // Load all weeks in a single query instead of one query per week
+        var rangeEndDate = lastMonday.AddDays(6);
+        var availabilities = await _context.Availabilities
+            .Where(a => a.EmployeeId == employeeId
+                && a.Date >= firstMonday
+                && a.Date <= rangeEndDate)
+            .ToListAsync();
+
+        var currentMonday = firstMonday;
 
         while (currentMonday <= end)
         {
-            var week = await GetWeekAvailabilityAsync(employeeId, FormatDateString(currentMonday));
-            weeks.Add(week);
+            var weekEndDate = currentMonday.AddDays(6);
+            var weekAvailabilities = availabilities
+                .Where(a => a.Date >= currentMonday && a.Date <= weekEndDate)
+                .ToList();
+
+            weeks.Add(BuildWeekAvailability(employeeId, employee.FullName, currentMonday, weekAvailabilities));
             currentMonday = currentMonday.AddDays(7);
         }
 
@@ -152,7 +143,6 @@ public class AvailabilityService : IAvailabilityService
                         existingAvailability.Status = day.Status.Value;
                         existingAvailability.Notes = string.IsNullOrWhiteSpace(day.Notes) ? null : day.Notes.Trim();
                         existingAvailability.UpdatedAt = DateTime.UtcNow;
-                        _context.Availabilities.Update(existingAvailability);
                     }
                 }
                 else
@@ -186,15 +176,18 @@ public class AvailabilityService : IAvailabilityService
 
         // Get all employees
         var employees = await _employeeService.GetAllEmployeesAsync();
-        var allWeekAvailabilities = new List<WeekAvailabilityDto>();
 
-        foreach (var employee in employees)
-        {
-            var weekAvailability = await GetWeekAvailabilityAsync(employee.Id, FormatDateString(mondayDate));
-            allWeekAvailabilities.Add(weekAvailability);
-        }
-
-        return allWeekAvailabilities.OrderBy(w => w.EmployeeName).ToList();
+        // Load the week for all employees in a single query instead of one query per employee
+        var weekEndDate = mondayDate.AddDays(6);
+        var availabilitiesByEmployee = (await _context.Availabilities
+            .Where(a => a.Date >= mondayDate && a.Date <= weekEndDate)
+            .ToListAsync())
+            .ToLookup(a => a.EmployeeId);
+
+        return employees
+            .Select(e => BuildWeekAvailability(e.Id, e.FullName, mondayDate, availabilitiesByEmployee[e.Id]))
+            .OrderBy(w => w.EmployeeName)
+            .ToList();
     }
 
     /// <summary>
@@ -203,48 +196,48 @@ public class AvailabilityService : IAvailabilityService
     /// </summary>
     public async Task UpdateAvailabilityForTimeOffAsync(int employeeId, DateTime startDate, DateTime endDate, AvailabilityStatus? status)
     {
-        var currentDate = startDate.Date;
+        if (status == null)
+        {
+            // Remove ALL availability records for these days - back to "not specified"
+            await RemoveAvailabilityForTimeOffAsync(employeeId, startDate, endDate);
+            return;
+        }
+
+        var firstDate = startDate.Date;
+        var lastDate = endDate.Date;
+
+        // Load the existing records for the whole period at once instead of querying per day
+        var existingAvailabilities = await _context.Availabilities
+            .Where(a => a.EmployeeId == employeeId && a.Date >= firstDate && a.Date <= lastDate)
+            .ToListAsync();
 
-        while (currentDate <= endDate.Date)
+        var existingByDate = existingAvailabilities
+            .GroupBy(a => a.Date.Date)
+            .ToDictionary(g => g.Key, g => g.First());
+
+        var currentDate = firstDate;
+
+        while (currentDate <= lastDate)
         {
-            if (status == null)
+            if (existingByDate.TryGetValue(currentDate, out var existingAvailability))
             {
-                // Remove ALL availability records for this day - back to "not specified"
-                var allRecordsForDay = await _context.Availabilities
-                    .Where(a => a.EmployeeId == employeeId && a.Date.Date == currentDate)
-                    .ToListAsync();
-
-                if (allRecordsForDay.Any())
-                {
-                    _context.Availabilities.RemoveRange(allRecordsForDay);
-                }
+                // Update existing availability
+                existingAvailability.Status = status.Value;
+                existingAvailability.UpdatedAt = DateTime.UtcNow;
             }
             else
             {
-                var existingAvailability = await _context.Availabilities
-                    .FirstOrDefaultAsync(a => a.EmployeeId == employeeId && a.Date.Date == currentDate);
-
-                if (existingAvailability != null)
-                {
-                    // Update existing availability
-                    existingAvailability.Status = status.Value;
-                    existingAvailability.UpdatedAt = DateTime.UtcNow;
-                    _context.Availabilities.Update(existingAvailability);
-                }
-                else
+                // Create new availability record
+                var availability = new Availability
                 {
-                    // Create new availability record
-                    var availability = new Availability
-                    {
-                        EmployeeId = employeeId,
-                        Date = currentDate,
-                        Status = status.Value,
-                        CreatedAt = DateTime.UtcNow,
-                        UpdatedAt = DateTime.UtcNow
-                    };
-
-                    _context.Availabilities.Add(availability);
-                }
+                    EmployeeId = employeeId,
+                    Date = currentDate,
+                    Status = status.Value,
+                    CreatedAt = DateTime.UtcNow,
+                    UpdatedAt = DateTime.UtcNow
+                };
+
+                _context.Availabilities.Add(availability);
             }
 
             currentDate = currentDate.AddDays(1);
@@ -259,24 +252,45 @@ public class AvailabilityService : IAvailabilityService
     /// </summary>
     public async Task RemoveAvailabilityForTimeOffAsync(int employeeId, DateTime startDate, DateTime endDate)
     {
-        var currentDate = startDate.Date;
+        var firstDate = startDate.Date;
+        var lastDate = endDate.Date;
+
+        // Remove ALL availability records for these days in a single DELETE - back to "not specified"
+        await _context.Availabilities
+            .Where(a => a.EmployeeId == employeeId && a.Date >= firstDate && a.Date <= lastDate)
+            .ExecuteDeleteAsync();
+    }
 
-        while (currentDate <= endDate.Date)
+    /// <summary>
+    /// Builds the Monday to Sunday overview for one employee from already loaded availability records
+    /// </summary>
+    private WeekAvailabilityDto BuildWeekAvailability(int employeeId, string employeeName, DateTime mondayDate, IEnumerable<Availability> availabilities)
+    {
+        var weekAvailability = new WeekAvailabilityDto
         {
-            // Remove ALL availability records for this day - back to "not specified"
-            var allRecordsForDay = await _context.Availabilities
-                .Where(a => a.EmployeeId == employeeId && a.Date.Date == currentDate)
-                .ToListAsync();
+            WeekStart = FormatDateString(mondayDate),
+            EmployeeId = employeeId,
+            EmployeeName = employeeName,
+            Days = new List<DayAvailabilityDto>()
+        };
 
-            if (allRecordsForDay.Any())
-            {
-                _context.Availabilities.RemoveRange(allRecordsForDay);
-            }
+        // Create 7 days (Monday to Sunday)
+        for (int i = 0; i < 7; i++)
+        {
+            var currentDate = mondayDate.AddDays(i);
+            var availability = availabilities.FirstOrDefault(a => a.Date.Date == currentDate.Date);
 
-            currentDate = currentDate.AddDays(1);
+            weekAvailability.Days.Add(new DayAvailabilityDto
+            {
+                Id = availability?.Id,
+                Date = FormatDateString(currentDate),
+                DayOfWeek = GetDutchDayName(currentDate),
+                Status = availability?.Status,
+                Notes = availability?.Notes
+            });
         }
 
-        await _context.SaveChangesAsync();
+        return weekAvailability;
     }
 
     public bool IsDateWithinAllowedRange(DateTime date)
@@ -303,15 +317,14 @@ public class AvailabilityService : IAvailabilityService
         }
 
         // Use the extension method for robust UTC handling
-        try
+        // TryParse avoids throwing and catching an exception for every non DD-MM-YYYY input
+        if (DateTimeExtensions.TryParseAsUtc(dateString, "dd-MM-yyyy", out var date))
         {
-            return DateTimeExtensions.ParseAsUtc(dateString, "dd-MM-yyyy");
-        }
-        catch
-        {
-            // Fallback to standard parsing
-            return DateTimeExtensions.ParseAsUtc(dateString);
+            return date;
         }
+
+        // Fallback to standard parsing
+        return DateTimeExtensions.ParseAsUtc(dateString);
     }
 
     public string FormatDateString(DateTime date)
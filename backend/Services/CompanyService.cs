@@ -35,7 +35,9 @@ public class CompanyService : ICompanyService
     {
         try
         {
+            // Read-only: no change tracking needed for mapping to DTOs
             var companies = await _context.Companies
+                .AsNoTracking()
                 .OrderBy(c => c.Name)
                 .ToListAsync();
 
@@ -53,6 +55,7 @@ public class CompanyService : ICompanyService
         try
         {
             var company = await _context.Companies
+                .AsNoTracking()
                 .FirstOrDefaultAsync(c => c.Id == id);
 
             return company == null ? null : MapToDto(company);
@@ -68,17 +71,8 @@ public class CompanyService : ICompanyService
     {
         try
         {
-            // Check for duplicate name
-            if (await CompanyNameExistsAsync(createDto.Name))
-            {
-                throw new InvalidOperationException($"A company with the name '{createDto.Name}' already exists.");
-            }
-
-            // Check for duplicate short name
-            if (await CompanyShortNameExistsAsync(createDto.ShortName))
-            {
-                throw new InvalidOperationException($"A company with the short name '{createDto.ShortName}' already exists.");
-            }
+            // Check for duplicate name and short name
+            await EnsureUniqueNamesAsync(createDto.Name, createDto.ShortName);
 
             var company = new Company
             {
@@ -119,17 +113,8 @@ public class CompanyService : ICompanyService
                 return null;
             }
 
-            // Check for duplicate name (excluding current company)
-            if (await CompanyNameExistsAsync(updateDto.Name, id))
-            {
-                throw new InvalidOperationException($"A company with the name '{updateDto.Name}' already exists.");
-            }
-
-            // Check for duplicate short name (excluding current company)
-            if (await CompanyShortNameExistsAsync(updateDto.ShortName, id))
-            {
-                throw new InvalidOperationException($"A company with the short name '{updateDto.ShortName}' already exists.");
-            }
+            // Check for duplicate name and short name (excluding current company)
+            await EnsureUniqueNamesAsync(updateDto.Name, updateDto.ShortName, id);
 
             company.Name = updateDto.Name;
             company.ShortName = updateDto.ShortName;
@@ -159,9 +144,7 @@ public class CompanyService : ICompanyService
     {
         try
         {
-            var company = await _context.Companies
-                .Include(c => c.Employees)
-                .FirstOrDefaultAsync(c => c.Id == id);
+            var company = await _context.Companies.FindAsync(id);
 
             if (company == null)
             {
@@ -169,7 +152,8 @@ public class CompanyService : ICompanyService
             }
 
             // Don't allow deletion if company has employees
-            if (company.Employees.Any())
+            // Checked with an EXISTS query instead of loading every employee of the company
+            if (await _context.Employees.AnyAsync(e => e.CompanyId == id))
             {
                 throw new InvalidOperationException("Cannot delete a company that has employees. Please reassign or remove all employees first.");
             }
@@ -221,6 +205,31 @@ public class CompanyService : ICompanyService
         return await query.AnyAsync();
     }
 
+    // Helper method that checks name and short name uniqueness in a single query
+    private async Task EnsureUniqueNamesAsync(string name, string shortName, int? excludeId = null)
+    {
+        var query = _context.Companies.Where(c => c.Name == name || c.ShortName == shortName);
+
+        if (excludeId.HasValue)
+        {
+            query = query.Where(c => c.Id != excludeId.Value);
+        }
+
+        var conflicts = await query
+            .Select(c => new { c.Name, c.ShortName })
+            .ToListAsync();
+
+        if (conflicts.Any(c => c.Name == name))
+        {
+            throw new InvalidOperationException($"A company with the name '{name}' already exists.");
+        }
+
+        if (conflicts.Any(c => c.ShortName == shortName))
+        {
+            throw new InvalidOperationException($"A company with the short name '{shortName}' already exists.");
+        }
+    }
+
     // Helper method to map Company entity to DTO
     private static CompanyDto MapToDto(Company company)
     {
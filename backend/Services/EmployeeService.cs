@@ -1,7 +1,9 @@
 using Microsoft.EntityFrameworkCore;
 using backend.Data;
+using backend.DTOs;
 using backend.Models;
 using backend.Extensions;
+using Npgsql;
 
 namespace backend.Services;
 
@@ -16,16 +18,44 @@ public class EmployeeService : IEmployeeService
 
     public async Task<IEnumerable<Employee>> GetAllEmployeesAsync()
     {
+        // Read-only listing: skip change tracking for every employee row
         return await _context.Employees
+            .AsNoTracking()
             .OrderBy(e => e.FirstName)
             .ThenBy(e => e.LastName)
             .ToListAsync();
     }
 
-    public async Task<Employee?> GetEmployeeByIdAsync(int id)
+    /// <summary>
+    /// Returns the employee list projected straight to response DTOs,
+    /// so only the exposed columns are selected (no password hash)
+    /// </summary>
+    public async Task<IEnumerable<EmployeeResponseDto>> GetAllEmployeeResponsesAsync()
     {
         return await _context.Employees
-            .FirstOrDefaultAsync(e => e.Id == id);
+            .OrderBy(e => e.FirstName)
+            .ThenBy(e => e.LastName)
+            .Select(e => new EmployeeResponseDto
+            {
+                Id = e.Id,
+                FirstName = e.FirstName,
+                LastName = e.LastName,
+                Username = e.Username,
+                FullName = e.FirstName + " " + e.LastName,
+                Role = e.Role,
+                HireDate = e.HireDate,
+                BirthDate = e.BirthDate,
+                CreatedAt = e.CreatedAt,
+                UpdatedAt = e.UpdatedAt
+            })
+            .ToListAsync();
+    }
+
+    public async Task<Employee?> GetEmployeeByIdAsync(int id)
+    {
+        // FindAsync returns an already tracked instance without a new query, so callers that
+        // look up the same employee more than once per request only hit the database once
+        return await _context.Employees.FindAsync(id);
     }
 
     public async Task<Employee?> GetEmployeeByUsernameAsync(string username)
@@ -36,17 +66,6 @@ public class EmployeeService : IEmployeeService
 
     public async Task<Employee> CreateEmployeeAsync(Employee employee, string password)
     {
-        // Enforce username uniqueness business rule
-        if (await UsernameExistsAsync(employee.Username))
-        {
-            throw new InvalidOperationException($"Username '{employee.Username}' already exists");
-        }
-
-        // Hash password using BCrypt for secure storage
-        employee.PasswordHash = BCrypt.Net.BCrypt.HashPassword(password);
-        employee.CreatedAt = DateTime.UtcNow;
-        employee.UpdatedAt = DateTime.UtcNow;
-
         // Ensure DateTime values have proper UTC kind for PostgreSQL compatibility
         employee.BirthDate = employee.BirthDate.EnsureUtc();
         employee.HireDate = employee.HireDate.EnsureUtc();
@@ -62,8 +81,23 @@ public class EmployeeService : IEmployeeService
             throw new InvalidOperationException("Hire date cannot be more than one day in the future");
         }
 
+        // Hash password using BCrypt for secure storage
+        // Done after the date checks so those rejections skip the deliberately slow hash. A duplicate
+        // username is only caught by the IX_Employees_Username unique index on insert, so it does pay for it
+        employee.PasswordHash = BCrypt.Net.BCrypt.HashPassword(password);
+        employee.CreatedAt = DateTime.UtcNow;
+        employee.UpdatedAt = DateTime.UtcNow;
+
         _context.Employees.Add(employee);
-        await _context.SaveChangesAsync();
+
+        try
+        {
+            await _context.SaveChangesAsync();
+        }
+        catch (DbUpdateException ex) when (IsUniqueViolation(ex))
+        {
+            throw new InvalidOperationException($"Username '{employee.Username}' already exists");
+        }
 
         return employee;
     }
@@ -76,13 +110,6 @@ public class EmployeeService : IEmployeeService
             return null;
         }
 
-        // Check username uniqueness only if username is being changed
-        if (existingEmployee.Username != employee.Username &&
-            await UsernameExistsAsync(employee.Username))
-        {
-            throw new InvalidOperationException($"Username '{employee.Username}' already exists");
-        }
-
         // Validate dates
         if (employee.BirthDate > DateTime.UtcNow)
         {
@@ -112,7 +139,16 @@ public class EmployeeService : IEmployeeService
             existingEmployee.PasswordHash = BCrypt.Net.BCrypt.HashPassword(employee.PasswordHash);
         }
 
-        await _context.SaveChangesAsync();
+        // A changed username that is already taken is rejected by the unique index
+        try
+        {
+            await _context.SaveChangesAsync();
+        }
+        catch (DbUpdateException ex) when (IsUniqueViolation(ex))
+        {
+            throw new InvalidOperationException($"Username '{employee.Username}' already exists");
+        }
+
         return existingEmployee;
     }
 
@@ -149,4 +185,10 @@ public class EmployeeService : IEmployeeService
 
         return BCrypt.Net.BCrypt.Verify(password, employee.PasswordHash);
     }
+
+    // Helper method to recognise a PostgreSQL unique constraint violation
+    private static bool IsUniqueViolation(DbUpdateException ex)
+    {
+        return ex.InnerException is PostgresException { SqlState: PostgresErrorCodes.UniqueViolation };
+    }
 }
\ No newline at end of file
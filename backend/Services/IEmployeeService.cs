@@ -1,3 +1,4 @@
+using backend.DTOs;
 using backend.Models;
 
 namespace backend.Services;
@@ -5,6 +6,7 @@ namespace backend.Services;
 public interface IEmployeeService
 {
     Task<IEnumerable<Employee>> GetAllEmployeesAsync();
+    Task<IEnumerable<EmployeeResponseDto>> GetAllEmployeeResponsesAsync();
     Task<Employee?> GetEmployeeByIdAsync(int id);
     Task<Employee?> GetEmployeeByUsernameAsync(string username);
     Task<Employee> CreateEmployeeAsync(Employee employee, string password);
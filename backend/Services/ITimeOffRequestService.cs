@@ -6,13 +6,13 @@ namespace backend.Services;
 public interface ITimeOffRequestService
 {
     Task<TimeOffRequest> CreateRequestAsync(int employeeId, CreateTimeOffRequestDto dto);
-    Task<TimeOffRequest> UpdateRequestAsync(int id, int employeeId, CreateTimeOffRequestDto dto);
+    Task<TimeOffRequest> UpdateRequestAsync(int id, int employeeId, string userRole, CreateTimeOffRequestDto dto);
     Task<TimeOffRequest> UpdateRequestAsManagerAsync(int id, UpdateTimeOffRequestAsManagerDto dto, string userRole);
     Task<IEnumerable<TimeOffRequestResponseDto>> GetAllRequestsAsync(TimeOffRequestFilterDto? filter = null);
     Task<TimeOffRequestResponseDto?> GetRequestByIdAsync(int id);
     Task<IEnumerable<TimeOffRequestResponseDto>> GetRequestsByEmployeeAsync(int employeeId);
     Task<TimeOffRequest> UpdateRequestStatusAsync(int id, UpdateTimeOffRequestStatusDto dto, int managerId);
     Task CancelRequestAsync(int id, int employeeId);
-    Task DeleteRequestAsync(int id, int employeeId);
+    Task DeleteRequestAsync(int id, int employeeId, string userRole);
     Task<bool> HasOverlappingRequestsAsync(int employeeId, DateTime startDate, DateTime endDate, int? excludeRequestId = null);
 }
\ No newline at end of file
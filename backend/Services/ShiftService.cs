@@ -3,6 +3,7 @@ using backend.Data;
 using backend.DTOs;
 using backend.Models;
 using System.Globalization;
+using System.Linq.Expressions;
 
 namespace backend.Services;
 
@@ -11,6 +12,25 @@ public class ShiftService : IShiftService
     private readonly ApplicationDbContext _context;
     private readonly IEmployeeService _employeeService;
 
+    // Projection for shift listings: only the employee's name is needed for the response,
+    // so the rest of the Employee row (password hash, dates, etc.) is not loaded
+    private static readonly Expression<Func<Shift, Shift>> ListProjection = s => new Shift
+    {
+        Id = s.Id,
+        EmployeeId = s.EmployeeId,
+        CompanyId = s.CompanyId,
+        Date = s.Date,
+        StartTime = s.StartTime,
+        EndTime = s.EndTime,
+        ShiftType = s.ShiftType,
+        IsOpenEnded = s.IsOpenEnded,
+        IsStandby = s.IsStandby,
+        Notes = s.Notes,
+        CreatedAt = s.CreatedAt,
+        UpdatedAt = s.UpdatedAt,
+        Employee = new Employee { FirstName = s.Employee.FirstName, LastName = s.Employee.LastName }
+    };
+
     public ShiftService(ApplicationDbContext context, IEmployeeService employeeService)
     {
         _context = context;
@@ -19,9 +39,7 @@ public class ShiftService : IShiftService
 
     public async Task<IEnumerable<ShiftResponseDto>> GetAllShiftsAsync(ShiftFilterDto? filter = null)
     {
-        var query = _context.Shifts
-            .Include(s => s.Employee)
-            .AsQueryable();
+        var query = _context.Shifts.AsQueryable();
 
         // Apply filters
         if (filter != null)
@@ -58,23 +76,20 @@ public class ShiftService : IShiftService
         }
 
         var shifts = await query
-            .OrderBy(s => s.Date)
-            .ToListAsync();
-
-        // Order by StartTime on the client side since SQLite doesn't support TimeSpan ordering
-        var orderedShifts = shifts
             .OrderBy(s => s.Date)
             .ThenBy(s => s.StartTime)
-            .ToList();
+            .Select(ListProjection)
+            .ToListAsync();
 
-        return orderedShifts.Select(ConvertToResponseDto);
+        return shifts.Select(ConvertToResponseDto);
     }
 
     public async Task<ShiftResponseDto?> GetShiftByIdAsync(int id)
     {
         var shift = await _context.Shifts
-            .Include(s => s.Employee)
-            .FirstOrDefaultAsync(s => s.Id == id);
+            .Where(s => s.Id == id)
+            .Select(ListProjection)
+            .FirstOrDefaultAsync();
 
         return shift != null ? ConvertToResponseDto(shift) : null;
     }
@@ -82,7 +97,6 @@ public class ShiftService : IShiftService
     public async Task<IEnumerable<ShiftResponseDto>> GetShiftsByEmployeeAsync(int employeeId, DateTime? startDate = null, DateTime? endDate = null)
     {
         var query = _context.Shifts
-            .Include(s => s.Employee)
             .Where(s => s.EmployeeId == employeeId);
 
         if (startDate.HasValue)
@@ -96,16 +110,12 @@ public class ShiftService : IShiftService
         }
 
         var shifts = await query
-            .OrderBy(s => s.Date)
-            .ToListAsync();
-
-        // Order by StartTime on the client side since SQLite doesn't support TimeSpan ordering
-        var orderedShifts = shifts
             .OrderBy(s => s.Date)
             .ThenBy(s => s.StartTime)
-            .ToList();
+            .Select(ListProjection)
+            .ToListAsync();
 
-        return orderedShifts.Select(ConvertToResponseDto);
+        return shifts.Select(ConvertToResponseDto);
     }
 
     public async Task<WeekScheduleDto> GetWeekScheduleAsync(string weekNumber)
@@ -229,7 +239,7 @@ public class ShiftService : IShiftService
     public async Task<bool> HasOverlappingShiftsAsync(int employeeId, DateTime date, TimeSpan startTime, TimeSpan? endTime, int? excludeShiftId = null)
     {
         var query = _context.Shifts
-            .Where(s => s.EmployeeId == employeeId && s.Date.Date == date.Date);
+            .Where(s => s.EmployeeId == employeeId && s.Date == date.Date);
 
         if (excludeShiftId.HasValue)
         {
@@ -238,41 +248,19 @@ public class ShiftService : IShiftService
 
         var existingShifts = await query.ToListAsync();
 
-        foreach (var existingShift in existingShifts)
-        {
-            // Skip overlap check for standby shifts as they don't guarantee work attendance
-            if (existingShift.IsStandby)
-                continue;
-
-            // For open-ended shifts, assume they go until end of day (23:59)
-            var existingEndTime = existingShift.IsOpenEnded ? new TimeSpan(23, 59, 59) : existingShift.EndTime;
-            var currentEndTime = endTime ?? new TimeSpan(23, 59, 59);
-
-            // Check for overlap: start before existing end AND end after existing start
-            if (startTime < existingEndTime && currentEndTime > existingShift.StartTime)
-            {
-                return true;
-            }
-        }
-
-        return false;
+        return OverlapsAny(existingShifts, startTime, endTime);
     }
 
     public async Task<IEnumerable<ShiftResponseDto>> GetShiftsByDateRangeAsync(DateTime startDate, DateTime endDate)
     {
         var shifts = await _context.Shifts
-            .Include(s => s.Employee)
             .Where(s => s.Date >= startDate && s.Date <= endDate)
-            .OrderBy(s => s.Date)
-            .ToListAsync();
-
-        // Order by StartTime on the client side since SQLite doesn't support TimeSpan ordering
-        var orderedShifts = shifts
             .OrderBy(s => s.Date)
             .ThenBy(s => s.StartTime)
-            .ToList();
+            .Select(ListProjection)
+            .ToListAsync();
 
-        return orderedShifts.Select(ConvertToResponseDto);
+        return shifts.Select(ConvertToResponseDto);
     }
 
     public async Task<IEnumerable<EmployeeResponseDto>> GetAvailableEmployeesAsync(DateTime date, TimeSpan startTime, TimeSpan? endTime)
@@ -280,12 +268,19 @@ public class ShiftService : IShiftService
         // Get all employees
         var allEmployees = await _employeeService.GetAllEmployeesAsync();
 
+        // Load the shifts of that day once and group them per employee,
+        // instead of running an overlap query for every employee
+        var shiftsByEmployee = (await _context.Shifts
+            .Where(s => s.Date == date.Date)
+            .ToListAsync())
+            .ToLookup(s => s.EmployeeId);
+
         // Get employees who don't have overlapping shifts
         var availableEmployees = new List<EmployeeResponseDto>();
 
         foreach (var employee in allEmployees)
         {
-            var hasOverlap = await HasOverlappingShiftsAsync(employee.Id, date, startTime, endTime);
+            var hasOverlap = OverlapsAny(shiftsByEmployee[employee.Id], startTime, endTime);
             if (!hasOverlap)
             {
                 availableEmployees.Add(new EmployeeResponseDto
@@ -342,9 +337,33 @@ public class ShiftService : IShiftService
         };
     }
 
+    private static bool OverlapsAny(IEnumerable<Shift> existingShifts, TimeSpan startTime, TimeSpan? endTime)
+    {
+        foreach (var existingShift in existingShifts)
+        {
+            // Skip overlap check for standby shifts as they don't guarantee work attendance
+            if (existingShift.IsStandby)
+                continue;
+
+            // For open-ended shifts, assume they go until end of day (23:59)
+            var existingEndTime = existingShift.IsOpenEnded ? new TimeSpan(23, 59, 59) : existingShift.EndTime;
+            var currentEndTime = endTime ?? new TimeSpan(23, 59, 59);
+
+            // Check for overlap: start before existing end AND end after existing start
+            if (startTime < existingEndTime && currentEndTime > existingShift.StartTime)
+            {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
     private async Task ValidateShiftAsync(int employeeId, DateTime date, TimeSpan startTime, TimeSpan? endTime, bool isOpenEnded)
     {
         // Validate that employee exists
+        // FindAsync is answered from the change tracker when the employee is already loaded,
+        // and tracks the employee so a reassigned shift's navigation is fixed up on save
         var employee = await _context.Employees.FindAsync(employeeId);
         if (employee == null)
         {
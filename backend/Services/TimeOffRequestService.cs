@@ -3,6 +3,7 @@ using backend.Data;
 using backend.DTOs;
 using backend.Models;
 using backend.Extensions;
+using System.Linq.Expressions;
 
 namespace backend.Services;
 
@@ -12,6 +13,24 @@ public class TimeOffRequestService : ITimeOffRequestService
     private readonly ILogger<TimeOffRequestService> _logger;
     private readonly IAvailabilityService _availabilityService;
 
+    // Projection for listing requests: only the names of the employee and approver are loaded,
+    // instead of the full Employee rows (password hash, dates, etc.)
+    private static readonly Expression<Func<TimeOffRequest, TimeOffRequest>> ListProjection = r => new TimeOffRequest
+    {
+        Id = r.Id,
+        EmployeeId = r.EmployeeId,
+        CompanyId = r.CompanyId,
+        Status = r.Status,
+        Reason = r.Reason,
+        StartDate = r.StartDate,
+        EndDate = r.EndDate,
+        ApprovedBy = r.ApprovedBy,
+        CreatedAt = r.CreatedAt,
+        UpdatedAt = r.UpdatedAt,
+        Employee = new Employee { FirstName = r.Employee.FirstName, LastName = r.Employee.LastName },
+        Approver = r.Approver == null ? null : new Employee { FirstName = r.Approver.FirstName, LastName = r.Approver.LastName }
+    };
+
     public TimeOffRequestService(ApplicationDbContext context, ILogger<TimeOffRequestService> logger, IAvailabilityService availabilityService)
     {
         _context = context;
@@ -69,10 +88,7 @@ public class TimeOffRequestService : ITimeOffRequestService
 
     public async Task<IEnumerable<TimeOffRequestResponseDto>> GetAllRequestsAsync(TimeOffRequestFilterDto? filter = null)
     {
-        var query = _context.TimeOffRequests
-            .Include(r => r.Employee)
-            .Include(r => r.Approver)
-            .AsQueryable();
+        var query = _context.TimeOffRequests.AsQueryable();
 
         if (filter != null)
         {
@@ -99,8 +115,22 @@ public class TimeOffRequestService : ITimeOffRequestService
             }
         }
 
-        var requests = await query
+        // Id as tie-breaker so page boundaries are stable between calls
+        query = query
             .OrderByDescending(r => r.CreatedAt)
+            .ThenByDescending(r => r.Id);
+
+        // Only page when the caller asks for it, so existing clients keep receiving the full list
+        if (filter?.PageSize != null)
+        {
+            var page = filter.Page ?? 1;
+            query = query
+                .Skip((page - 1) * filter.PageSize.Value)
+                .Take(filter.PageSize.Value);
+        }
+
+        var requests = await query
+            .Select(ListProjection)
             .ToListAsync();
 
         return requests.Select(ConvertToResponseDto);
@@ -109,9 +139,9 @@ public class TimeOffRequestService : ITimeOffRequestService
     public async Task<TimeOffRequestResponseDto?> GetRequestByIdAsync(int id)
     {
         var request = await _context.TimeOffRequests
-            .Include(r => r.Employee)
-            .Include(r => r.Approver)
-            .FirstOrDefaultAsync(r => r.Id == id);
+            .Where(r => r.Id == id)
+            .Select(ListProjection)
+            .FirstOrDefaultAsync();
 
         return request != null ? ConvertToResponseDto(request) : null;
     }
@@ -119,10 +149,9 @@ public class TimeOffRequestService : ITimeOffRequestService
     public async Task<IEnumerable<TimeOffRequestResponseDto>> GetRequestsByEmployeeAsync(int employeeId)
     {
         var requests = await _context.TimeOffRequests
-            .Include(r => r.Employee)
-            .Include(r => r.Approver)
             .Where(r => r.EmployeeId == employeeId)
             .OrderByDescending(r => r.CreatedAt)
+            .Select(ListProjection)
             .ToListAsync();
 
         return requests.Select(ConvertToResponseDto);
@@ -156,7 +185,9 @@ public class TimeOffRequestService : ITimeOffRequestService
         request.ApprovedBy = managerId;
         request.UpdatedAt = DateTimeExtensions.UtcNow;
 
-        _context.TimeOffRequests.Update(request);
+        // Status change and availability sync are committed together in one transaction
+        await using var transaction = await _context.Database.BeginTransactionAsync();
+
         await _context.SaveChangesAsync();
 
         // Handle availability updates based on status changes
@@ -192,6 +223,8 @@ public class TimeOffRequestService : ITimeOffRequestService
             );
         }
 
+        await transaction.CommitAsync();
+
         _logger.LogInformation("Vrij aanvraag {Id} bijgewerkt door manager", id);
 
         return request;
@@ -246,7 +279,9 @@ public class TimeOffRequestService : ITimeOffRequestService
         request.Status = status;
         request.UpdatedAt = DateTimeExtensions.UtcNow;
 
-        _context.TimeOffRequests.Update(request);
+        // Request update and availability sync are committed together in one transaction
+        await using var transaction = await _context.Database.BeginTransactionAsync();
+
         await _context.SaveChangesAsync();
 
         // Handle availability updates based on status changes
@@ -282,12 +317,14 @@ public class TimeOffRequestService : ITimeOffRequestService
             );
         }
 
+        await transaction.CommitAsync();
+
         _logger.LogInformation("Vrij aanvraag {Id} bijgewerkt door manager", id);
 
         return request;
     }
 
-    public async Task<TimeOffRequest> UpdateRequestAsync(int id, int employeeId, CreateTimeOffRequestDto dto)
+    public async Task<TimeOffRequest> UpdateRequestAsync(int id, int employeeId, string userRole, CreateTimeOffRequestDto dto)
     {
         var request = await _context.TimeOffRequests.FindAsync(id);
 
@@ -297,13 +334,8 @@ public class TimeOffRequestService : ITimeOffRequestService
         }
 
         // Check access: employees can only edit their own requests, managers can edit any
-        var currentEmployee = await _context.Employees.FindAsync(employeeId);
-        if (currentEmployee == null)
-        {
-            throw new InvalidOperationException("Werknemer niet gevonden");
-        }
-
-        var isManager = currentEmployee.Role == Role.Manager;
+        // The role comes from the JWT claim, so no extra lookup of the current employee is needed
+        var isManager = userRole == "Manager";
 
         if (!isManager && request.EmployeeId != employeeId)
         {
@@ -351,7 +383,6 @@ public class TimeOffRequestService : ITimeOffRequestService
         request.Reason = dto.Reason;
         request.UpdatedAt = DateTimeExtensions.UtcNow;
 
-        _context.TimeOffRequests.Update(request);
         await _context.SaveChangesAsync();
 
         _logger.LogInformation("Vrij aanvraag {Id} bijgewerkt door {Role}",
@@ -379,7 +410,6 @@ public class TimeOffRequestService : ITimeOffRequestService
         request.Status = TimeOffStatus.Cancelled;
         request.UpdatedAt = DateTimeExtensions.UtcNow;
 
-        _context.TimeOffRequests.Update(request);
         await _context.SaveChangesAsync();
 
         // If was approved, remove availability (back to "not specified")
@@ -395,14 +425,10 @@ public class TimeOffRequestService : ITimeOffRequestService
         _logger.LogInformation("Vrij aanvraag {Id} geannuleerd door werknemer {EmployeeId}", id, employeeId);
     }
 
-    public async Task DeleteRequestAsync(int id, int employeeId)
+    public async Task DeleteRequestAsync(int id, int employeeId, string userRole)
     {
-        // Check if user is manager
-        var currentEmployee = await _context.Employees.FindAsync(employeeId);
-        var isManager = currentEmployee?.Role == Role.Manager;
-
         // Only managers can delete requests
-        if (!isManager)
+        if (userRole != "Manager")
         {
             throw new InvalidOperationException("Alleen managers kunnen vrij aanvragen verwijderen");
         }
@@ -415,6 +441,9 @@ public class TimeOffRequestService : ITimeOffRequestService
             throw new InvalidOperationException("Aanvraag niet gevonden");
         }
 
+        // Availability cleanup and removal of the request are committed together in one transaction
+        await using var transaction = await _context.Database.BeginTransactionAsync();
+
         // If was approved, remove availability (back to "not specified")
         if (request.Status == TimeOffStatus.Approved)
         {
@@ -427,6 +456,7 @@ public class TimeOffRequestService : ITimeOffRequestService
 
         _context.TimeOffRequests.Remove(request);
         await _context.SaveChangesAsync();
+        await transaction.CommitAsync();
 
         _logger.LogInformation("Vrij aanvraag {Id} verwijderd door manager {ManagerId}", id, employeeId);
     }
@@ -172,10 +172,11 @@ export default function EmployeesPage() {
   }
 
   // Filter employees based on search term
+  const normalizedSearchTerm = searchTerm.toLowerCase();
   const filteredEmployees = employees.filter(
     (employee) =>
-      employee.fullName.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      employee.username.toLowerCase().includes(searchTerm.toLowerCase())
+      employee.fullName.toLowerCase().includes(normalizedSearchTerm) ||
+      employee.username.toLowerCase().includes(normalizedSearchTerm)
   );
 
   return (
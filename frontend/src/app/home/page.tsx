@@ -38,6 +38,17 @@ import {
   generateTimeSlots,
 } from "@/utils/scheduleUtils";
 
+// Map abbreviated day names to full lowercase names
+const FULL_DAY_NAMES: { [key: string]: string } = {
+  ma: "maandag",
+  di: "dinsdag",
+  wo: "woensdag",
+  do: "donderdag",
+  vr: "vrijdag",
+  za: "zaterdag",
+  zo: "zondag",
+};
+
 export default function HomePage() {
   usePageTitle("Dashboard - Home");
 
@@ -409,18 +420,7 @@ export default function HomePage() {
     const currentWeek = getCurrentWeekAvailability();
     if (!currentWeek) return null;
 
-    // Map abbreviated day names to full lowercase names
-    const dayMap: { [key: string]: string } = {
-      ma: "maandag",
-      di: "dinsdag",
-      wo: "woensdag",
-      do: "donderdag",
-      vr: "vrijdag",
-      za: "zaterdag",
-      zo: "zondag",
-    };
-
-    const fullDayName = dayMap[dayName.toLowerCase()];
+    const fullDayName = FULL_DAY_NAMES[dayName.toLowerCase()];
     if (!fullDayName) return null;
 
     // Find day by dayOfWeek property
@@ -139,27 +139,34 @@ export default function ScheduleManagePage() {
 
   const loadAllEmployeesAvailability = async () => {
     setIsLoadingAvailability(true);
+    const weekDates = getWeekDates(currentWeekDate);
+    const mondayDate = weekDates[0];
+    const weekStart = formatDate(mondayDate);
+
+    // Return empty availability data when nothing is known for the employee
+    const createEmptyWeek = (employee: Employee): WeekAvailability => ({
+      employeeId: employee.id,
+      weekStart: weekStart,
+      employeeName: employee.fullName,
+      days: [],
+    });
+
     try {
-      const weekDates = getWeekDates(currentWeekDate);
-      const mondayDate = weekDates[0];
-      const weekStart = formatDate(mondayDate);
-
-      const availabilityPromises = employees.map((employee) =>
-        api
-          .getEmployeeWeekAvailability(employee.id, weekStart)
-          .then((data) => ({ ...data, employeeId: employee.id }))
-          .catch(() => ({
-            employeeId: employee.id,
-            weekStart: weekStart,
-            employeeName: employee.fullName,
-            days: [],
-          }))
+      // Fetch the whole team in one request instead of one request per employee
+      const weekData = await api.getAllEmployeesWeekAvailability(weekStart);
+      const weekDataByEmployee = new Map(
+        weekData.map((week) => [week.employeeId, week])
       );
 
-      const availabilityData = await Promise.all(availabilityPromises);
+      const availabilityData = employees.map(
+        (employee) =>
+          weekDataByEmployee.get(employee.id) ?? createEmptyWeek(employee)
+      );
       setAllEmployeesAvailability(availabilityData);
     } catch (error: unknown) {
       console.error("Error loading availability:", error);
+      // Don't keep showing the previous week's availability
+      setAllEmployeesAvailability(employees.map(createEmptyWeek));
     } finally {
       setIsLoadingAvailability(false);
     }
@@ -36,18 +36,20 @@ import {
 
 type ViewType = "week" | "month" | "day";
 
+// Short day names for mobile, defined once instead of on every call
+const SHORT_DAY_NAMES: { [key: string]: string } = {
+  maandag: "ma",
+  dinsdag: "di",
+  woensdag: "wo",
+  donderdag: "do",
+  vrijdag: "vr",
+  zaterdag: "za",
+  zondag: "zo",
+};
+
 // Helper function to get short day names for mobile
 const getShortDayName = (dayName: string): string => {
-  const shortNames: { [key: string]: string } = {
-    maandag: "ma",
-    dinsdag: "di",
-    woensdag: "wo",
-    donderdag: "do",
-    vrijdag: "vr",
-    zaterdag: "za",
-    zondag: "zo",
-  };
-  return shortNames[dayName.toLowerCase()] || dayName;
+  return SHORT_DAY_NAMES[dayName.toLowerCase()] || dayName;
 };
 
 export default function SchedulePage() {
@@ -24,6 +24,7 @@ import {
   X,
 } from "lucide-react";
 import * as api from "@/lib/api";
+import { TimeOffStatus, getTimeOffStatusText } from "@/types/timeoff";
 
 // Types voor vrij aanvragen
 interface TimeOffRequest {
@@ -40,6 +41,44 @@ interface TimeOffRequest {
   updatedAt: string;
 }
 
+// Status panel styling per backend status, built once instead of on every render
+const STATUS_STYLES: Record<
+  string,
+  { bg: string; border: string; text: string; icon: React.ReactNode }
+> = {
+  [TimeOffStatus.Approved]: {
+    bg: "bg-green-50",
+    border: "border-green-200",
+    text: "text-green-800",
+    icon: <CheckCircle className="h-5 w-5 text-green-600" />,
+  },
+  [TimeOffStatus.Rejected]: {
+    bg: "bg-red-50",
+    border: "border-red-200",
+    text: "text-red-800",
+    icon: <XCircle className="h-5 w-5 text-red-600" />,
+  },
+  [TimeOffStatus.Pending]: {
+    bg: "bg-yellow-50",
+    border: "border-yellow-200",
+    text: "text-yellow-800",
+    icon: <Clock className="h-5 w-5 text-yellow-600" />,
+  },
+  [TimeOffStatus.Cancelled]: {
+    bg: "bg-gray-50",
+    border: "border-gray-200",
+    text: "text-gray-800",
+    icon: <XCircle className="h-5 w-5 text-gray-600" />,
+  },
+};
+
+const DEFAULT_STATUS_STYLE = {
+  bg: "bg-gray-50",
+  border: "border-gray-200",
+  text: "text-gray-800",
+  icon: <Clock className="h-5 w-5 text-gray-600" />,
+};
+
 export default function TimeOffDetailPage() {
   const params = useParams();
   const requestId = parseInt(params.id as string);
@@ -91,61 +130,6 @@ export default function TimeOffDetailPage() {
     }
   };
 
-  const getStatusColor = (status: string) => {
-    switch (status.toLowerCase()) {
-      case "approved":
-        return {
-          bg: "bg-green-50",
-          border: "border-green-200",
-          text: "text-green-800",
-          icon: <CheckCircle className="h-5 w-5 text-green-600" />,
-        };
-      case "rejected":
-        return {
-          bg: "bg-red-50",
-          border: "border-red-200",
-          text: "text-red-800",
-          icon: <XCircle className="h-5 w-5 text-red-600" />,
-        };
-      case "pending":
-        return {
-          bg: "bg-yellow-50",
-          border: "border-yellow-200",
-          text: "text-yellow-800",
-          icon: <Clock className="h-5 w-5 text-yellow-600" />,
-        };
-      case "cancelled":
-        return {
-          bg: "bg-gray-50",
-          border: "border-gray-200",
-          text: "text-gray-800",
-          icon: <XCircle className="h-5 w-5 text-gray-600" />,
-        };
-      default:
-        return {
-          bg: "bg-gray-50",
-          border: "border-gray-200",
-          text: "text-gray-800",
-          icon: <Clock className="h-5 w-5 text-gray-600" />,
-        };
-    }
-  };
-
-  const getStatusText = (status: string) => {
-    switch (status.toLowerCase()) {
-      case "approved":
-        return "Goedgekeurd";
-      case "rejected":
-        return "Afgewezen";
-      case "pending":
-        return "In behandeling";
-      case "cancelled":
-        return "Geannuleerd";
-      default:
-        return status;
-    }
-  };
-
   const formatDateLong = (dateString: string): string => {
     const [day, month, year] = dateString.split("-");
     const date = new Date(parseInt(year), parseInt(month) - 1, parseInt(day));
@@ -257,7 +241,7 @@ export default function TimeOffDetailPage() {
     );
   }
 
-  const statusInfo = getStatusColor(request.status);
+  const statusInfo = STATUS_STYLES[request.status] ?? DEFAULT_STATUS_STYLE;
 
   return (
     <div
@@ -379,12 +363,12 @@ export default function TimeOffDetailPage() {
                   >
                     Status:{" "}
                     <span className={statusInfo.text}>
-                      {getStatusText(request.status)}
+                      {getTimeOffStatusText(request.status)}
                     </span>
                   </h2>
                   {request.approverName && (
                     <p className="text-sm mt-1" style={{ color: "#67697c" }}>
-                      {request.status.toLowerCase() === "approved"
+                      {request.status === TimeOffStatus.Approved
                         ? "Goedgekeurd"
                         : "Behandeld"}{" "}
                       door: {request.approverName}
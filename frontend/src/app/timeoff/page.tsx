@@ -21,6 +21,7 @@ import {
   Clock,
 } from "lucide-react";
 import * as api from "@/lib/api";
+import { getTimeOffStatusText } from "@/types/timeoff";
 
 // Types voor vrij aanvragen
 interface TimeOffRequest {
@@ -44,6 +45,18 @@ interface TimeOffFilter {
   toDate?: string;
 }
 
+// Badge styling per backend status, looked up directly instead of
+// normalising and switching on every rendered row
+const STATUS_COLORS: Record<string, string> = {
+  Approved: "bg-green-100 text-green-800",
+  Rejected: "bg-red-100 text-red-800",
+  Pending: "bg-yellow-100 text-yellow-800",
+  Cancelled: "bg-gray-100 text-gray-800",
+};
+
+const getStatusColor = (status: string) =>
+  STATUS_COLORS[status] ?? "bg-gray-100 text-gray-800";
+
 export default function TimeOffPage() {
   usePageTitle("Dashboard - Vrij aanvragen");
 
@@ -88,36 +101,6 @@ export default function TimeOffPage() {
     }
   };
 
-  const getStatusColor = (status: string) => {
-    switch (status.toLowerCase()) {
-      case "approved":
-        return "bg-green-100 text-green-800";
-      case "rejected":
-        return "bg-red-100 text-red-800";
-      case "pending":
-        return "bg-yellow-100 text-yellow-800";
-      case "cancelled":
-        return "bg-gray-100 text-gray-800";
-      default:
-        return "bg-gray-100 text-gray-800";
-    }
-  };
-
-  const getStatusText = (status: string) => {
-    switch (status.toLowerCase()) {
-      case "approved":
-        return "Goedgekeurd";
-      case "rejected":
-        return "Afgewezen";
-      case "pending":
-        return "In behandeling";
-      case "cancelled":
-        return "Geannuleerd";
-      default:
-        return status;
-    }
-  };
-
   const handleDeleteRequest = (request: TimeOffRequest) => {
     // Only managers can delete requests
     if (!isManager()) {
@@ -176,10 +159,11 @@ export default function TimeOffPage() {
   }
 
   // Filter requests based on search term
+  const normalizedSearchTerm = searchTerm.toLowerCase();
   const filteredRequests = requests.filter(
     (request) =>
-      request.employeeName.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      request.reason.toLowerCase().includes(searchTerm.toLowerCase())
+      request.employeeName.toLowerCase().includes(normalizedSearchTerm) ||
+      request.reason.toLowerCase().includes(normalizedSearchTerm)
   );
 
   return (
@@ -500,7 +484,7 @@ export default function TimeOffPage() {
                               )}`}
                             >
                               <Clock className="h-3 w-3 mr-1" />
-                              {getStatusText(request.status)}
+                              {getTimeOffStatusText(request.status)}
                             </span>
                           </td>
                           <td className="px-6 py-4">
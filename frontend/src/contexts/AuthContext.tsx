@@ -6,6 +6,17 @@ import * as api from "@/lib/api";
 
 const AuthContext = createContext<AuthContextType | undefined>(undefined);
 
+// Display names per role, built once at module level
+const ROLE_NAMES: Record<Role, string> = {
+  [Role.SuperAdmin]: "Super Admin",
+  [Role.Manager]: "Manager",
+  [Role.ShiftLeider]: "Shift leider",
+  [Role.Werknemer]: "Werknemer",
+};
+
+// Defined outside the provider so the function keeps the same identity across renders
+const getRoleName = (role: Role): string => ROLE_NAMES[role] ?? "Onbekend";
+
 export const useAuth = () => {
   const context = useContext(AuthContext);
   if (context === undefined) {
@@ -167,21 +178,6 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
     return user.role >= requiredRole;
   };
 
-  const getRoleName = (role: Role): string => {
-    switch (role) {
-      case Role.SuperAdmin:
-        return "Super Admin";
-      case Role.Manager:
-        return "Manager";
-      case Role.ShiftLeider:
-        return "Shift leider";
-      case Role.Werknemer:
-        return "Werknemer";
-      default:
-        return "Onbekend";
-    }
-  };
-
   const value = {
     user,
     company,
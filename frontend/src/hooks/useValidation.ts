@@ -1,4 +1,4 @@
-import { useState, useCallback } from "react";
+import { useState, useCallback, useMemo } from "react";
 import { ValidationManager, ValidationRules } from "@/utils/validation";
 
 interface UseValidationOptions {
@@ -43,8 +43,12 @@ export const useValidation = (
 ): UseValidationReturn => {
   const { fields, customRules, validateOnChange = true } = options;
 
-  // Initialize validation manager
-  const validationManager = new ValidationManager(customRules);
+  // Initialize validation manager once per set of rules instead of on every render,
+  // which also keeps the callbacks below from being recreated each render
+  const validationManager = useMemo(
+    () => new ValidationManager(customRules),
+    [customRules]
+  );
 
   // Field errors state
   const [fieldErrors, setFieldErrors] = useState<Record<string, string>>({});
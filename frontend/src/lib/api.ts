@@ -540,6 +540,17 @@ export const getEmployeeWeekAvailability = async (
   );
 };
 
+export const getAllEmployeesWeekAvailability = async (
+  weekStart: string,
+  options: ApiCallOptions = {}
+): Promise<WeekAvailability[]> => {
+  return apiRequest(
+    `/availability/all-employees/week/${weekStart}`,
+    {},
+    options
+  );
+};
+
 export const getAvailabilityDateRange = async (
   options: ApiCallOptions = {}
 ): Promise<DateRangeInfo> => {
@@ -43,22 +43,18 @@ export interface TimeOffRequestFilter {
   toDate?: string; // DD-MM-YYYY format
 }
 
-// Utility function to get status display text in Dutch
-export const getTimeOffStatusText = (status: TimeOffStatus): string => {
-  switch (status) {
-    case TimeOffStatus.Pending:
-      return "Aangevraagd";
-    case TimeOffStatus.Approved:
-      return "Goedgekeurd";
-    case TimeOffStatus.Rejected:
-      return "Afgekeurd";
-    case TimeOffStatus.Cancelled:
-      return "Geannuleerd";
-    default:
-      return "Onbekend";
-  }
+// Dutch status labels, keyed by the status string the backend sends
+export const TIME_OFF_STATUS_LABELS: Record<string, string> = {
+  [TimeOffStatus.Approved]: "Goedgekeurd",
+  [TimeOffStatus.Rejected]: "Afgewezen",
+  [TimeOffStatus.Pending]: "In behandeling",
+  [TimeOffStatus.Cancelled]: "Geannuleerd",
 };
 
+// Utility function to get status display text in Dutch, falling back to the raw status
+export const getTimeOffStatusText = (status: TimeOffStatus | string): string =>
+  TIME_OFF_STATUS_LABELS[status] ?? status;
+
 // Utility function to get status color
 export const getTimeOffStatusColor = (status: TimeOffStatus): string => {
   switch (status) {
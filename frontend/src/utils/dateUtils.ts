@@ -3,6 +3,47 @@
  * Ensures consistent DD-MM-YYYY format throughout the application
  */
 
+/**
+ * Checks the fixed DD-MM-YYYY layout with plain character tests instead of a regex:
+ * ten characters, dashes at positions 2 and 5, digits everywhere else
+ */
+const hasDdMmYyyyShape = (value: string): boolean => {
+  if (value.length !== 10 || value[2] !== "-" || value[5] !== "-") {
+    return false;
+  }
+
+  for (let i = 0; i < 10; i++) {
+    if (i === 2 || i === 5) continue;
+    const code = value.charCodeAt(i);
+    if (code < 48 || code > 57) return false;
+  }
+
+  return true;
+};
+
+/**
+ * Builds a Date from a DD-MM-YYYY string, or null when the layout or the
+ * calendar date is invalid (e.g. 31-02-2023)
+ */
+const parseDdMmYyyy = (value: string): Date | null => {
+  if (!hasDdMmYyyyShape(value)) return null;
+
+  const day = Number(value.slice(0, 2));
+  const month = Number(value.slice(3, 5));
+  const year = Number(value.slice(6));
+  const date = new Date(year, month - 1, day);
+
+  if (
+    date.getDate() === day &&
+    date.getMonth() === month - 1 &&
+    date.getFullYear() === year
+  ) {
+    return date;
+  }
+
+  return null;
+};
+
 /**
  * Formats a Date object or date string to DD-MM-YYYY string
  */
@@ -13,10 +54,7 @@ export const formatDate = (date: Date | string): string => {
 
   if (typeof date === "string") {
     // Check if it's already in DD-MM-YYYY format
-    const ddmmyyyyRegex = /^(\d{2})-(\d{2})-(\d{4})$/;
-    const match = date.match(ddmmyyyyRegex);
-
-    if (match) {
+    if (hasDdMmYyyyShape(date)) {
       // Already in DD-MM-YYYY format, return as is
       return date;
     }
@@ -45,21 +83,9 @@ export const parseDate = (dateString: string): Date | null => {
   if (!dateString) return null;
 
   // Handle DD-MM-YYYY format
-  const ddmmyyyyRegex = /^(\d{2})-(\d{2})-(\d{4})$/;
-  const match = dateString.match(ddmmyyyyRegex);
-
-  if (match) {
-    const [, day, month, year] = match;
-    const date = new Date(parseInt(year), parseInt(month) - 1, parseInt(day));
-
-    // Validate the date is correct (handles invalid dates like 31-02-2023)
-    if (
-      date.getDate() === parseInt(day) &&
-      date.getMonth() === parseInt(month) - 1 &&
-      date.getFullYear() === parseInt(year)
-    ) {
-      return date;
-    }
+  const date = parseDdMmYyyy(dateString);
+  if (date) {
+    return date;
   }
 
   // Fallback to standard Date parsing
@@ -109,21 +135,24 @@ export const getCurrentDate = (): string => {
 export const isValidDateFormat = (dateString: string): boolean => {
   if (!dateString) return false;
 
-  const ddmmyyyyRegex = /^(\d{2})-(\d{2})-(\d{4})$/;
-  const match = dateString.match(ddmmyyyyRegex);
-
-  if (!match) return false;
-
-  const [, day, month, year] = match;
-  const date = new Date(parseInt(year), parseInt(month) - 1, parseInt(day));
-
-  return (
-    date.getDate() === parseInt(day) &&
-    date.getMonth() === parseInt(month) - 1 &&
-    date.getFullYear() === parseInt(year)
-  );
+  return parseDdMmYyyy(dateString) !== null;
 };
 
+const DUTCH_MONTH_NAMES = [
+  "januari",
+  "februari",
+  "maart",
+  "april",
+  "mei",
+  "juni",
+  "juli",
+  "augustus",
+  "september",
+  "oktober",
+  "november",
+  "december",
+];
+
 /**
  * Formats date range in Dutch readable format (e.g., "30 juli - 8 augustus")
  */
@@ -133,25 +162,10 @@ export const formatDateRange = (startDateStr: string, endDateStr: string): strin
 
   if (!startDate || !endDate) return "";
 
-  const months = [
-    "januari",
-    "februari",
-    "maart",
-    "april",
-    "mei",
-    "juni",
-    "juli",
-    "augustus",
-    "september",
-    "oktober",
-    "november",
-    "december",
-  ];
-
   const startDay = startDate.getDate();
-  const startMonth = months[startDate.getMonth()];
+  const startMonth = DUTCH_MONTH_NAMES[startDate.getMonth()];
   const endDay = endDate.getDate();
-  const endMonth = months[endDate.getMonth()];
+  const endMonth = DUTCH_MONTH_NAMES[endDate.getMonth()];
 
   if (startDateStr === endDateStr) {
     return `${startDay} ${startMonth}`;
@@ -1,3 +1,5 @@
+import { isValidDateFormat } from "@/utils/dateUtils";
+
 export interface ValidationRule {
   required?: boolean;
   minLength?: number;
@@ -24,23 +26,49 @@ const sanitizeInput = (input: string): string => {
     .replace(/['";]/g, ""); // Remove SQL injection characters
 };
 
+// Patterns are created once at module load instead of on every validation call
+const DANGEROUS_PATTERNS = [
+  /<script/i,
+  /javascript:/i,
+  /on\w+=/i,
+  /sql/i,
+  /union/i,
+  /select/i,
+  /insert/i,
+  /update/i,
+  /delete/i,
+  /drop/i,
+  /exec/i,
+  /script/i,
+];
+
+const USERNAME_START_PATTERN = /^[a-zA-Z0-9]/;
+const USERNAME_END_PATTERN = /[a-zA-Z0-9]$/;
+const USERNAME_CONSECUTIVE_SPECIALS_PATTERN = /[._-]{2,}/;
+
 const containsDangerousPatterns = (input: string): boolean => {
-  const dangerousPatterns = [
-    /<script/i,
-    /javascript:/i,
-    /on\w+=/i,
-    /sql/i,
-    /union/i,
-    /select/i,
-    /insert/i,
-    /update/i,
-    /delete/i,
-    /drop/i,
-    /exec/i,
-    /script/i,
-  ];
-
-  return dangerousPatterns.some((pattern) => pattern.test(input));
+  return DANGEROUS_PATTERNS.some((pattern) => pattern.test(input));
+};
+
+// Checks the password character requirements in a single pass over the string
+const checkPasswordCharacters = (value: string): string | null => {
+  if (!value) return null;
+
+  let hasUppercase = false;
+  let hasDigit = false;
+
+  for (let i = 0; i < value.length && !(hasUppercase && hasDigit); i++) {
+    const code = value.charCodeAt(i);
+    if (code >= 65 && code <= 90) {
+      hasUppercase = true; // A-Z
+    } else if (code >= 48 && code <= 57) {
+      hasDigit = true; // 0-9
+    }
+  }
+
+  if (!hasUppercase) return "Wachtwoord moet minimaal 1 hoofdletter bevatten";
+  if (!hasDigit) return "Wachtwoord moet minimaal 1 cijfer bevatten";
+  return null;
 };
 
 export class ValidationManager {
@@ -101,17 +129,17 @@ export class ValidationManager {
           }
 
           // Must start with letter or number
-          if (!/^[a-zA-Z0-9]/.test(trimmed)) {
+          if (!USERNAME_START_PATTERN.test(trimmed)) {
             return "Gebruikersnaam moet beginnen met een letter of cijfer";
           }
 
           // Must end with letter or number
-          if (!/[a-zA-Z0-9]$/.test(trimmed)) {
+          if (!USERNAME_END_PATTERN.test(trimmed)) {
             return "Gebruikersnaam moet eindigen met een letter of cijfer";
           }
 
           // No consecutive special characters
-          if (/[._-]{2,}/.test(trimmed)) {
+          if (USERNAME_CONSECUTIVE_SPECIALS_PATTERN.test(trimmed)) {
             return "Gebruikersnaam mag geen opeenvolgende speciale tekens bevatten";
           }
 
@@ -124,27 +152,13 @@ export class ValidationManager {
     password: [
       { required: true, message: "Wachtwoord is verplicht" },
       { minLength: 6, message: "Wachtwoord moet minimaal 6 tekens bevatten" },
-      {
-        pattern: /(?=.*[A-Z])/,
-        message: "Wachtwoord moet minimaal 1 hoofdletter bevatten",
-      },
-      {
-        pattern: /(?=.*\d)/,
-        message: "Wachtwoord moet minimaal 1 cijfer bevatten",
-      },
+      { custom: checkPasswordCharacters },
     ],
 
     // Optional password (for updates)
     passwordOptional: [
       { minLength: 6, message: "Wachtwoord moet minimaal 6 tekens bevatten" },
-      {
-        pattern: /(?=.*[A-Z])/,
-        message: "Wachtwoord moet minimaal 1 hoofdletter bevatten",
-      },
-      {
-        pattern: /(?=.*\d)/,
-        message: "Wachtwoord moet minimaal 1 cijfer bevatten",
-      },
+      { custom: checkPasswordCharacters },
     ],
 
     // Password confirmation
@@ -166,27 +180,8 @@ export class ValidationManager {
         custom: (value: string) => {
           if (!value || !value.trim()) return null;
 
-          // Check if it's in DD-MM-YYYY format
-          const dateRegex = /^(\d{2})-(\d{2})-(\d{4})$/;
-          const match = value.match(dateRegex);
-          
-          if (!match) {
-            return "Ongeldige datum";
-          }
-
-          const [, day, month, year] = match;
-          const date = new Date(parseInt(year), parseInt(month) - 1, parseInt(day));
-
-          // Validate the date is correct (handles invalid dates like 31-02-2023)
-          if (
-            date.getDate() === parseInt(day) &&
-            date.getMonth() === parseInt(month) - 1 &&
-            date.getFullYear() === parseInt(year)
-          ) {
-            return null; // Valid date
-          }
-
-          return "Ongeldige datum";
+          // Check the DD-MM-YYYY format and that the date exists (handles invalid dates like 31-02-2023)
+          return isValidDateFormat(value) ? null : "Ongeldige datum";
         },
       },
     ],